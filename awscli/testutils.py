@@ -31,6 +31,7 @@ import platform
 import contextlib
 import string
 import binascii
+import collections
 from pprint import pformat
 from subprocess import Popen, PIPE
 
@@ -377,8 +378,15 @@ class BaseAWSCommandParamsTest(unittest.TestCase):
             self.make_request_is_patched = False
         make_request_patch = self.make_request_patch.start()
         if self.parsed_responses is not None:
+            # Responses are consumed from the front, so use a deque to
+            # avoid shifting the remaining responses on every request.
+            # The whole list is handed off in one go; a queue left over
+            # from an earlier call is reused as is.
+            if not isinstance(self.parsed_responses, collections.deque):
+                self.parsed_responses = collections.deque(
+                    self.parsed_responses)
             make_request_patch.side_effect = lambda *args, **kwargs: \
-                (self.http_response, self.parsed_responses.pop(0))
+                (self.http_response, self.parsed_responses.popleft())
         else:
             make_request_patch.return_value = (self.http_response, self.parsed_response)
         self.make_request_is_patched = True
@@ -14,6 +14,7 @@ import os
 
 import awscli.customizations.s3.utils as utils
 from awscli.compat import six
+from awscli.customizations.s3.fileinfo import FileInfo
 from awscli.testutils import BaseAWSCommandParamsTest, FileCreator, \
     capture_output
 
@@ -51,6 +52,26 @@ class S3HandlerBaseTest(BaseAWSCommandParamsTest):
         stdout = captured.stdout.getvalue()
         return stdout, stderr, rc
 
+    def create_upload_tasks(self, sources, destinations, size=0,
+                            operation_name='upload'):
+        """Create a task uploading each local source to its s3 destination
+
+        :param sources: An iterable of local filenames
+        :param destinations: An iterable of s3 paths, paired up in order
+            with ``sources``.
+        """
+        return [
+            FileInfo(src=src, src_type='local', dest=dest, dest_type='s3',
+                     operation_name=operation_name, size=size,
+                     client=self.client)
+            for src, dest in zip(sources, destinations)
+        ]
+
+    def assert_file_contents(self, filename, expected):
+        """Assert that a local file holds exactly the expected bytes"""
+        with open(filename, 'rb') as f:
+            self.assertEqual(f.read(), expected)
+
     def assert_operations_for_s3_handler(self, s3_handler, tasks,
                                          ref_operations,
                                          verify_no_failed_tasked=True):
@@ -65,11 +86,9 @@ class S3HandlerBaseTest(BaseAWSCommandParamsTest):
         stdout, stderr, rc = self.run_s3_handler(s3_handler, tasks)
         if verify_no_failed_tasked:
             self.assertEqual(rc.num_tasks_failed, 0)
-        self.assertEqual(len(self.operations_called), len(ref_operations))
-        for i, ref_operation in enumerate(ref_operations):
-            self.assertEqual(self.operations_called[i][0].name,
-                             ref_operation[0])
-            self.assertEqual(self.operations_called[i][1], ref_operation[1])
+        operations = [(model.name, params)
+                      for model, params in self.operations_called]
+        self.assertEqual(operations, list(ref_operations))
 
 
 def make_loc_files(file_creator, size=None):
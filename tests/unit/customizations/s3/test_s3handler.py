@@ -12,22 +12,22 @@
 # language governing permissions and limitations under the License.
 import datetime
 import os
-import random
-import sys
+from io import BytesIO
 
-import mock
-from s3transfer.manager import TransferManager, TransferFuture
+try:
+    from unittest import mock
+except ImportError:
+    # Python 2 does not ship mock in the standard library.
+    import mock
 
 import awscli.customizations.s3.utils
-from awscli.testutils import unittest, capture_input
-from awscli import EnvironmentVariables
-from awscli.compat import six
+from awscli.testutils import unittest, capture_input, FileCreator
 from awscli.customizations.s3.s3handler import S3Handler
 from awscli.customizations.s3.s3handler import S3TransferStreamHandler
 from awscli.customizations.s3.fileinfo import FileInfo
-from awscli.customizations.s3.tasks import CreateMultipartUploadTask, \
-    UploadPartTask, CreateLocalFileTask, CompleteMultipartUploadTask
-from awscli.customizations.s3.utils import MAX_PARTS, MAX_UPLOAD_SIZE
+from awscli.customizations.s3.tasks import CompleteMultipartUploadTask
+from awscli.customizations.s3.utils import MAX_PARTS, MAX_UPLOAD_SIZE, \
+    MAX_SINGLE_UPLOAD_SIZE
 from awscli.customizations.s3.utils import StablePriorityQueue
 from awscli.customizations.s3.utils import ProvideSizeSubscriber
 from awscli.customizations.s3.transferconfig import RuntimeConfig
@@ -35,15 +35,43 @@ from tests.unit.customizations.s3 import make_loc_files, clean_loc_files, \
     S3HandlerBaseTest
 
 
+_ETAG = '"120ea8a25e5d487bf68b5f7096440019"'
+
+# The buckets the tests transfer to and from. _S3_FILES match the local
+# files made by make_loc_files.
+_BUCKET = 'mybucket'
+_BUCKET2 = 'mybucket2'
+_S3_FILES = (_BUCKET + '/text1.txt', _BUCKET + '/another_directory/text2.txt')
+
+# The contents of every object downloaded in these tests.
+_TEST_BODY = b'This is a test.'
+# _TEST_BODY split into the 5 byte parts of a multipart download.
+_TEST_BODY_PARTS = (b'This ', b'is a ', b'test.')
+# The Range requested for each of those parts.
+_TEST_BODY_RANGES = ('bytes=0-4', 'bytes=5-9', 'bytes=10-')
+# What the stream upload tests feed in on stdin.
+_STREAM_INPUT = b'foobar'
+
+# Used as the last modified time of objects being downloaded.
+_FIXED_TIME = datetime.datetime(2020, 1, 1)
+
+_RUNTIME_CONFIG_CACHE = {}
+
+
 def runtime_config(**kwargs):
-    return RuntimeConfig().build_config(**kwargs)
+    # Building the config is the same for a given set of overrides, so
+    # only do it once per set and hand out copies of the result.
+    key = tuple(sorted(kwargs.items()))
+    if key not in _RUNTIME_CONFIG_CACHE:
+        _RUNTIME_CONFIG_CACHE[key] = RuntimeConfig().build_config(**kwargs)
+    return _RUNTIME_CONFIG_CACHE[key].copy()
 
 
 # The point of this class is some condition where an error
 # occurs during the enqueueing of tasks.
 class CompleteTaskNotAllowedQueue(StablePriorityQueue):
     def _put(self, item):
-        if isinstance(item, CompleteMultipartUploadTask):
+        if type(item) is CompleteMultipartUploadTask:
             # Raising this exception will trigger the
             # "error" case shutdown in the executor.
             raise RuntimeError(
@@ -51,6 +79,67 @@ class CompleteTaskNotAllowedQueue(StablePriorityQueue):
         return StablePriorityQueue._put(self, item)
 
 
+class FakeStreamingBody(BytesIO):
+    """An in-memory stand-in for a botocore ``StreamingBody``.
+
+    Multipart downloads set a socket timeout on the body before reading
+    from it, which is a no-op here.
+    """
+    def set_socket_timeout(self, timeout):
+        pass
+
+
+class FakeTransferFuture(object):
+    """A minimal stand-in for an s3transfer ``TransferFuture``."""
+    def __init__(self):
+        self.result = mock.Mock()
+
+
+class FakeTransferManager(object):
+    """A minimal stand-in for an s3transfer ``TransferManager``.
+
+    Only the parts used by ``S3TransferStreamHandler`` are provided, and
+    every transfer returns the given future.
+    """
+    def __init__(self, future):
+        self.upload = mock.Mock(return_value=future)
+        self.download = mock.Mock(return_value=future)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def download_part_responses():
+    """Create the GetObject responses for a multipart download
+
+    Each ranged GetObject gets its own body holding the matching part
+    of ``_TEST_BODY``.
+    """
+    return [{'ETag': _ETAG, 'Body': FakeStreamingBody(part)}
+            for part in _TEST_BODY_PARTS]
+
+
+def download_part_calls(bucket, key):
+    """Create the ranged GetObject calls made for a multipart download"""
+    return tuple(
+        ('GetObject', {'Bucket': bucket, 'Key': key, 'Range': byte_range})
+        for byte_range in _TEST_BODY_RANGES
+    )
+
+
+_S3_DELETE_REF_CALLS = (
+    ('DeleteObject',
+     {'Bucket': _BUCKET, 'Key': 'another_directory/text2.txt'}),
+    ('DeleteObject',
+     {'Bucket': _BUCKET, 'Key': 'text1.txt'}),
+    ('DeleteObject',
+     {'Bucket': _BUCKET, 'Key': 'another_directory/'}),
+)
+
+
 class S3HandlerTestDelete(S3HandlerBaseTest):
     """
     This tests the ability to delete both files locally and in s3.
@@ -62,7 +151,7 @@ class S3HandlerTestDelete(S3HandlerBaseTest):
                                     runtime_config=runtime_config(
                                         max_concurrent_requests=1))
         self.loc_files = make_loc_files(self.file_creator)
-        self.bucket = 'mybucket'
+        self.bucket = _BUCKET
 
     def test_loc_delete(self):
         """
@@ -70,13 +159,14 @@ class S3HandlerTestDelete(S3HandlerBaseTest):
         generated from filegenerator_test.py.
         """
         files = [self.loc_files[0], self.loc_files[1]]
-        tasks = []
         for filename in files:
             self.assertTrue(os.path.exists(filename))
-            tasks.append(FileInfo(
-                src=filename, src_type='local',
-                dest_type='s3', operation_name='delete', size=0,
-                client=self.client))
+        tasks = [
+            FileInfo(src=filename, src_type='local',
+                     dest_type='s3', operation_name='delete', size=0,
+                     client=self.client)
+            for filename in files
+        ]
         ref_calls = []
         self.assert_operations_for_s3_handler(self.s3_handler, tasks,
                                               ref_calls)
@@ -91,22 +181,15 @@ class S3HandlerTestDelete(S3HandlerBaseTest):
         keys = [self.bucket + '/another_directory/text2.txt',
                 self.bucket + '/text1.txt',
                 self.bucket + '/another_directory/']
-        tasks = []
-        for key in keys:
-            tasks.append(FileInfo(
-                src=key, src_type='s3',
-                dest_type='local', operation_name='delete',
-                size=0,
-                client=self.client,
-                source_client=self.source_client))
-        ref_calls = [
-            ('DeleteObject',
-             {'Bucket': self.bucket, 'Key': 'another_directory/text2.txt'}),
-            ('DeleteObject',
-             {'Bucket': self.bucket, 'Key': 'text1.txt'}),
-            ('DeleteObject',
-             {'Bucket': self.bucket, 'Key': 'another_directory/'})
+        tasks = [
+            FileInfo(src=key, src_type='s3',
+                     dest_type='local', operation_name='delete',
+                     size=0,
+                     client=self.client,
+                     source_client=self.source_client)
+            for key in keys
         ]
+        ref_calls = _S3_DELETE_REF_CALLS
         self.assert_operations_for_s3_handler(self.s3_handler, tasks,
                                               ref_calls)
 
@@ -115,8 +198,10 @@ class S3HandlerTestURLEncodeDeletes(S3HandlerBaseTest):
     def setUp(self):
         super(S3HandlerTestURLEncodeDeletes, self).setUp()
         params = {'region': 'us-east-1'}
-        self.s3_handler = S3Handler(self.session, params)
-        self.bucket = 'mybucket'
+        self.s3_handler = S3Handler(self.session, params,
+                                    runtime_config=runtime_config(
+                                        max_concurrent_requests=1))
+        self.bucket = _BUCKET
 
     def test_s3_delete_url_encode(self):
         """
@@ -135,11 +220,69 @@ class S3HandlerTestURLEncodeDeletes(S3HandlerBaseTest):
                                               ref_calls)
 
 
+_PUT_OBJECT_REF_CALLS = (
+    ('PutObject',
+     {'Bucket': _BUCKET, 'Key': 'text1.txt', 'Body': mock.ANY,
+      'ContentType': 'text/plain', 'ACL': 'private'}),
+    ('PutObject',
+     {'Bucket': _BUCKET, 'Key': 'another_directory/text2.txt',
+      'ContentType': 'text/plain', 'Body': mock.ANY, 'ACL': 'private'}),
+)
+
+_MULTI_UPLOAD_REF_CALLS = (
+    ('CreateMultipartUpload',
+     {'Bucket': _BUCKET, 'ContentType': 'text/plain',
+      'Key': 'text1.txt', 'ACL': 'private'}),
+    ('UploadPart',
+     {'Body': mock.ANY, 'Bucket': _BUCKET, 'PartNumber': 1,
+      'UploadId': 'foo', 'Key': 'text1.txt'}),
+    ('UploadPart',
+     {'Body': mock.ANY, 'Bucket': _BUCKET, 'PartNumber': 2,
+      'UploadId': 'foo', 'Key': 'text1.txt'}),
+    ('CompleteMultipartUpload',
+     {'MultipartUpload': {'Parts': [{'PartNumber': 1,
+                                     'ETag': mock.ANY},
+                                    {'PartNumber': 2,
+                                     'ETag': mock.ANY}]},
+      'Bucket': _BUCKET, 'UploadId': 'foo', 'Key': 'text1.txt'}),
+)
+
+_MULTI_UPLOAD_ABORT_REF_CALLS = (
+    ('CreateMultipartUpload',
+     {'Bucket': _BUCKET, 'ContentType': 'text/plain',
+      'Key': 'text1.txt', 'ACL': 'private'}),
+    ('UploadPart',
+     {'Body': mock.ANY, 'Bucket': _BUCKET, 'PartNumber': 1,
+      'UploadId': 'foo', 'Key': 'text1.txt'}),
+    # Here we'll see an error because of a msising ETag.
+    ('UploadPart',
+     {'Body': mock.ANY, 'Bucket': _BUCKET, 'PartNumber': 2,
+      'UploadId': 'foo', 'Key': 'text1.txt'}),
+    # And we should have the final call be an AbortMultipartUpload.
+    ('AbortMultipartUpload',
+     {'Bucket': _BUCKET, 'Key': 'text1.txt', 'UploadId': 'foo'}),
+)
+
+
 class S3HandlerTestUpload(S3HandlerBaseTest):
     """
     This class tests the ability to upload objects into an S3 bucket as
     well as multipart uploads
     """
+    bucket = _BUCKET
+    s3_files = _S3_FILES
+
+    @classmethod
+    def setUpClass(cls):
+        # None of the upload tests modify the local files, so they only
+        # need to be written to disk once for the whole class.
+        cls.loc_file_creator = FileCreator()
+        cls.loc_files = make_loc_files(cls.loc_file_creator)
+
+    @classmethod
+    def tearDownClass(cls):
+        clean_loc_files(cls.loc_file_creator)
+
     def setUp(self):
         super(S3HandlerTestUpload, self).setUp()
         params = {'region': 'us-east-1', 'acl': 'private', 'quiet': True}
@@ -151,36 +294,19 @@ class S3HandlerTestUpload(S3HandlerBaseTest):
             runtime_config=runtime_config(
                 multipart_threshold=10, multipart_chunksize=10,
                 max_concurrent_requests=1))
-        self.bucket = 'mybucket'
-        self.loc_files = make_loc_files(self.file_creator)
-        self.s3_files = [self.bucket + '/text1.txt',
-                         self.bucket + '/another_directory/text2.txt']
 
     def test_upload(self):
         # Create file info objects to perform upload.
         files = [self.loc_files[0], self.loc_files[1]]
-        tasks = []
-        for i in range(len(files)):
-            tasks.append(FileInfo(
-                src=self.loc_files[i],
-                dest=self.s3_files[i],
-                operation_name='upload', size=0,
-                client=self.client))
+        tasks = self.create_upload_tasks(files, self.s3_files)
         # Perform the upload.
         self.parsed_responses = [
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'}
+            {'ETag': _ETAG},
+            {'ETag': _ETAG}
         ]
         stdout, stderr, rc = self.run_s3_handler(self.s3_handler, tasks)
         self.assertEqual(rc.num_tasks_failed, 0)
-        ref_calls = [
-            ('PutObject',
-             {'Bucket': self.bucket, 'Key': 'text1.txt', 'Body': mock.ANY,
-              'ContentType': 'text/plain',  'ACL': 'private'}),
-            ('PutObject',
-             {'Bucket': self.bucket, 'Key': 'another_directory/text2.txt',
-              'ContentType': 'text/plain', 'Body': mock.ANY, 'ACL': 'private'})
-        ]
+        ref_calls = _PUT_OBJECT_REF_CALLS
         self.assert_operations_for_s3_handler(self.s3_handler, tasks,
                                               ref_calls)
 
@@ -192,21 +318,11 @@ class S3HandlerTestUpload(S3HandlerBaseTest):
         fail_s3_files = [self.bucket + '/text1.txt',
                          self.bucket[:-1] + '/another_directory/text2.txt']
         files = [self.loc_files[0], self.loc_files[1]]
-        tasks = []
-        for i in range(len(files)):
-            tasks.append(FileInfo(
-                src=self.loc_files[i],
-                dest=fail_s3_files[i],
-                compare_key=None,
-                src_type='local',
-                dest_type='s3',
-                operation_name='upload', size=0,
-                last_update=None,
-                client=self.client))
+        tasks = self.create_upload_tasks(files, fail_s3_files)
         # Since there is only one parsed response. The process will fail
         # becasue it is expecting one more response.
         self.parsed_responses = [
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'},
+            {'ETag': _ETAG},
         ]
         stdout, stderr, rc = self.run_s3_handler(self.s3_handler, tasks)
         self.assertEqual(rc.num_tasks_failed, 1)
@@ -216,17 +332,9 @@ class S3HandlerTestUpload(S3HandlerBaseTest):
         This test verifies that we're warning on file uploads which are greater
         than the max upload size (5TB currently).
         """
-        tasks = [FileInfo(
-            src=self.loc_files[0],
-            dest=self.bucket + '/test1.txt',
-            compare_key=None,
-            src_type='local',
-            dest_type='s3',
-            operation_name='upload',
-            size=MAX_UPLOAD_SIZE+1,
-            last_update=None,
-            client=self.client
-        )]
+        tasks = self.create_upload_tasks(
+            [self.loc_files[0]], [self.bucket + '/test1.txt'],
+            size=MAX_UPLOAD_SIZE+1)
         self.parsed_responses = []
         _, _, rc = self.run_s3_handler(self.s3_handler, tasks)
         # The task should *warn*, not fail
@@ -240,36 +348,14 @@ class S3HandlerTestUpload(S3HandlerBaseTest):
         perform any tests past checking the parts are uploaded correctly.
         """
         files = [self.loc_files[0]]
-        tasks = []
-        for i in range(len(files)):
-            tasks.append(FileInfo(
-                src=self.loc_files[i],
-                dest=self.s3_files[i], size=15,
-                operation_name='upload',
-                client=self.client))
+        tasks = self.create_upload_tasks(files, self.s3_files, size=15)
         self.parsed_responses = [
             {'UploadId': 'foo'},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'},
+            {'ETag': _ETAG},
+            {'ETag': _ETAG},
             {}
         ]
-        ref_calls = [
-            ('CreateMultipartUpload',
-             {'Bucket': 'mybucket', 'ContentType': 'text/plain',
-              'Key': 'text1.txt', 'ACL': 'private'}),
-            ('UploadPart',
-             {'Body': mock.ANY, 'Bucket': 'mybucket', 'PartNumber': 1,
-              'UploadId': 'foo', 'Key': 'text1.txt'}),
-            ('UploadPart',
-             {'Body': mock.ANY, 'Bucket': 'mybucket', 'PartNumber': 2,
-              'UploadId': 'foo', 'Key': 'text1.txt'}),
-            ('CompleteMultipartUpload',
-             {'MultipartUpload': {'Parts': [{'PartNumber': 1,
-                                             'ETag': mock.ANY},
-                                            {'PartNumber': 2,
-                                             'ETag': mock.ANY}]},
-              'Bucket': 'mybucket', 'UploadId': 'foo', 'Key': 'text1.txt'})
-        ]
+        ref_calls = _MULTI_UPLOAD_REF_CALLS
         self.assert_operations_for_s3_handler(self.s3_handler_multi, tasks,
                                               ref_calls)
 
@@ -280,16 +366,10 @@ class S3HandlerTestUpload(S3HandlerBaseTest):
         a nonexisting bucket, connection error, and md5 error.
         """
         files = [self.loc_files[0]]
-        tasks = []
-        for i in range(len(files)):
-            tasks.append(FileInfo(
-                src=self.loc_files[i],
-                dest=self.s3_files[i], size=15,
-                operation_name='upload',
-                client=self.client))
+        tasks = self.create_upload_tasks(files, self.s3_files, size=15)
         self.parsed_responses = [
             {'UploadId': 'foo'},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'},
+            {'ETag': _ETAG},
             # This will cause a failure for the second part upload because
             # it does not have an ETag.
             {},
@@ -300,47 +380,25 @@ class S3HandlerTestUpload(S3HandlerBaseTest):
         self.assertEqual(rc.num_tasks_failed, 1)
 
     def test_multiupload_abort_in_s3_handler(self):
-        tasks = [
-            FileInfo(src=self.loc_files[0],
-                     dest=self.s3_files[0], size=15,
-                     operation_name='upload',
-                     client=self.client)
-        ]
+        tasks = self.create_upload_tasks(
+            [self.loc_files[0]], [self.s3_files[0]], size=15)
         self.parsed_responses = [
             {'UploadId': 'foo'},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'},
+            {'ETag': _ETAG},
             # This will cause a failure for the second part upload because
             # it does not have an ETag.
             {},
             {}
         ]
-        expected_calls = [
-            ('CreateMultipartUpload',
-             {'Bucket': 'mybucket', 'ContentType': 'text/plain',
-              'Key': 'text1.txt', 'ACL': 'private'}),
-            ('UploadPart',
-             {'Body': mock.ANY, 'Bucket': 'mybucket', 'PartNumber': 1,
-              'UploadId': 'foo', 'Key': 'text1.txt'}),
-            # Here we'll see an error because of a msising ETag.
-            ('UploadPart',
-             {'Body': mock.ANY, 'Bucket': 'mybucket', 'PartNumber': 2,
-              'UploadId': 'foo', 'Key': 'text1.txt'}),
-            # And we should have the final call be an AbortMultipartUpload.
-            ('AbortMultipartUpload',
-             {'Bucket': 'mybucket', 'Key': 'text1.txt', 'UploadId': 'foo'}),
-        ]
+        expected_calls = _MULTI_UPLOAD_ABORT_REF_CALLS
         self.assert_operations_for_s3_handler(self.s3_handler_multi, tasks,
                                               expected_calls,
                                               verify_no_failed_tasked=False)
 
     def test_multipart_abort_for_half_queues(self):
         self.s3_handler_multi.executor.queue = CompleteTaskNotAllowedQueue()
-        tasks = [
-            FileInfo(src=self.loc_files[0],
-                     dest=self.s3_files[0], size=15,
-                     operation_name='upload',
-                     client=self.client)
-        ]
+        tasks = self.create_upload_tasks(
+            [self.loc_files[0]], [self.s3_files[0]], size=15)
         self.parsed_responses = [
             {'UploadId': 'foo'},
             {'ETag': 'abcd'},
@@ -364,7 +422,16 @@ class S3HandlerTestUpload(S3HandlerBaseTest):
             self.assertEqual(self.operations_called[-1][0].name, 'AbortMultipartUpload')
 
 
-class S3HandlerTestMvLocalS3(S3HandlerBaseTest):
+class S3HandlerMoveBaseTest(S3HandlerBaseTest):
+    """Holds the buckets and keys shared by the move and copy tests."""
+    bucket = _BUCKET
+    bucket2 = _BUCKET2
+    s3_files = _S3_FILES
+    s3_files2 = (_BUCKET2 + '/text1.txt',
+                 _BUCKET2 + '/another_directory/text2.txt')
+
+
+class S3HandlerTestMvLocalS3(S3HandlerMoveBaseTest):
     """
     This class tests the ability to move s3 objects.  The move
     operation uses a upload then delete.
@@ -375,34 +442,19 @@ class S3HandlerTestMvLocalS3(S3HandlerBaseTest):
         self.s3_handler = S3Handler(self.session, params,
                                     runtime_config=runtime_config(
                                         max_concurrent_requests=1))
-        self.bucket = 'mybucket'
         self.loc_files = make_loc_files(self.file_creator)
-        self.s3_files = [self.bucket + '/text1.txt',
-                         self.bucket + '/another_directory/text2.txt']
 
     def test_move(self):
         # Create file info objects to perform move.
         files = [self.loc_files[0], self.loc_files[1]]
-        tasks = []
-        for i in range(len(files)):
-            tasks.append(FileInfo(
-                src=self.loc_files[i], src_type='local',
-                dest=self.s3_files[i], dest_type='s3',
-                operation_name='move', size=0,
-                client=self.client))
+        tasks = self.create_upload_tasks(files, self.s3_files,
+                                         operation_name='move')
         self.parsed_responses = [
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'}
+            {'ETag': _ETAG},
+            {'ETag': _ETAG}
         ]
 
-        ref_calls = [
-            ('PutObject',
-             {'Bucket': self.bucket, 'Key': 'text1.txt', 'Body': mock.ANY,
-              'ContentType': 'text/plain', 'ACL': 'private'}),
-            ('PutObject',
-             {'Bucket': self.bucket, 'Key': 'another_directory/text2.txt',
-              'ContentType': 'text/plain', 'Body': mock.ANY, 'ACL': 'private'})
-        ]
+        ref_calls = _PUT_OBJECT_REF_CALLS
         # Perform the move.
         self.assert_operations_for_s3_handler(self.s3_handler, tasks,
                                               ref_calls)
@@ -411,7 +463,34 @@ class S3HandlerTestMvLocalS3(S3HandlerBaseTest):
             self.assertFalse(os.path.exists(filename))
 
 
-class S3HandlerTestMvS3S3(S3HandlerBaseTest):
+_MV_S3_S3_REF_CALLS = (
+    ('CopyObject',
+     {'Bucket': _BUCKET2, 'Key': 'text1.txt',
+      'CopySource': _BUCKET + '/text1.txt', 'ACL': 'private',
+      'ContentType': 'text/plain'}),
+    ('DeleteObject', {'Bucket': _BUCKET, 'Key': 'text1.txt'}),
+    ('CopyObject',
+     {'Bucket': _BUCKET2, 'Key': 'another_directory/text2.txt',
+      'CopySource': _BUCKET + '/another_directory/text2.txt',
+      'ACL': 'private', 'ContentType': 'text/plain'}),
+    ('DeleteObject',
+     {'Bucket': _BUCKET, 'Key': 'another_directory/text2.txt'}),
+)
+
+_MV_S3_S3_UNICODE_REF_CALLS = (
+    ('CopyObject',
+     {'Bucket': _BUCKET, 'Key': u'\u2713',
+      # Implementation detail, but the botocore handler
+      # now fixes up CopySource in before-call so it will
+      # show up in the operations_called.
+      'CopySource': _BUCKET2 + u'/%E2%9C%93',
+      'ACL': 'private'}),
+    ('DeleteObject',
+     {'Bucket': _BUCKET2, 'Key': u'\u2713'}),
+)
+
+
+class S3HandlerTestMvS3S3(S3HandlerMoveBaseTest):
     """
     This class tests the ability to move s3 objects.  The move
     operation uses a copy then delete.
@@ -422,35 +501,17 @@ class S3HandlerTestMvS3S3(S3HandlerBaseTest):
         self.s3_handler = S3Handler(self.session, params,
                                     runtime_config=runtime_config(
                                         max_concurrent_requests=1))
-        self.bucket = 'mybucket'
-        self.bucket2 = 'mybucket2'
-        self.s3_files = [self.bucket + '/text1.txt',
-                         self.bucket + '/another_directory/text2.txt']
-        self.s3_files2 = [self.bucket2 + '/text1.txt',
-                          self.bucket2 + '/another_directory/text2.txt']
 
     def test_move(self):
         # Create file info objects to perform move.
-        tasks = []
-        for i in range(len(self.s3_files)):
-            tasks.append(FileInfo(
-                src=self.s3_files[i], src_type='s3',
-                dest=self.s3_files2[i], dest_type='s3',
-                operation_name='move', size=0,
-                client=self.client, source_client=self.source_client))
-        ref_calls = [
-            ('CopyObject',
-             {'Bucket': self.bucket2, 'Key': 'text1.txt',
-              'CopySource': self.bucket + '/text1.txt', 'ACL': 'private',
-              'ContentType': 'text/plain'}),
-            ('DeleteObject', {'Bucket': self.bucket, 'Key': 'text1.txt'}),
-            ('CopyObject',
-             {'Bucket': self.bucket2, 'Key': 'another_directory/text2.txt',
-              'CopySource': self.bucket + '/another_directory/text2.txt',
-              'ACL': 'private', 'ContentType': 'text/plain'}),
-            ('DeleteObject',
-             {'Bucket': self.bucket, 'Key': 'another_directory/text2.txt'}),
+        tasks = [
+            FileInfo(src=src, src_type='s3',
+                     dest=dest, dest_type='s3',
+                     operation_name='move', size=0,
+                     client=self.client, source_client=self.source_client)
+            for src, dest in zip(self.s3_files, self.s3_files2)
         ]
+        ref_calls = _MV_S3_S3_REF_CALLS
         # Perform the move.
         self.assert_operations_for_s3_handler(self.s3_handler, tasks,
                                               ref_calls)
@@ -466,22 +527,27 @@ class S3HandlerTestMvS3S3(S3HandlerBaseTest):
             source_client=self.source_client
         )]
 
-        ref_calls = [
-            ('CopyObject',
-             {'Bucket': self.bucket, 'Key': u'\u2713',
-              # Implementation detail, but the botocore handler
-              # now fixes up CopySource in before-call so it will
-              # show up in the operations_called.
-              'CopySource': u'mybucket2/%E2%9C%93',
-              'ACL': 'private'}),
-            ('DeleteObject',
-             {'Bucket': self.bucket2, 'Key': u'\u2713'})
-        ]
+        ref_calls = _MV_S3_S3_UNICODE_REF_CALLS
         self.assert_operations_for_s3_handler(self.s3_handler, tasks,
                                               ref_calls)
 
 
-class S3HandlerTestMvS3Local(S3HandlerBaseTest):
+_MV_S3_LOCAL_REF_CALLS = (
+    ('GetObject', {'Bucket': _BUCKET, 'Key': 'text1.txt'}),
+    ('DeleteObject', {'Bucket': _BUCKET, 'Key': 'text1.txt'}),
+    ('GetObject',
+     {'Bucket': _BUCKET, 'Key': 'another_directory/text2.txt'}),
+    ('DeleteObject',
+     {'Bucket': _BUCKET, 'Key': 'another_directory/text2.txt'}),
+)
+
+_MV_S3_LOCAL_MULTI_REF_CALLS = (
+    download_part_calls(_BUCKET, 'text1.txt') +
+    (('DeleteObject', {'Bucket': _BUCKET, 'Key': 'text1.txt'}),)
+)
+
+
+class S3HandlerTestMvS3Local(S3HandlerMoveBaseTest):
     """
     This class tests the ability to move s3 objects.  The move
     operation uses a download then delete.
@@ -497,100 +563,85 @@ class S3HandlerTestMvS3Local(S3HandlerBaseTest):
             runtime_config=runtime_config(
                 multipart_threshold=10, multipart_chunksize=5,
                 max_concurrent_requests=1))
-        self.bucket = 'mybucket'
-        self.s3_files = [self.bucket + '/text1.txt',
-                         self.bucket + '/another_directory/text2.txt']
-        directory1 = self.file_creator.rootdir + os.sep + 'some_directory' \
-            + os.sep
-        filename1 = directory1 + "text1.txt"
-        directory2 = directory1 + 'another_directory' + os.sep
-        filename2 = directory2 + "text2.txt"
-        self.loc_files = [filename1, filename2]
+        directory1 = os.path.join(self.file_creator.rootdir, 'some_directory')
+        filename1 = os.path.join(directory1, 'text1.txt')
+        filename2 = os.path.join(directory1, 'another_directory', 'text2.txt')
+        self.loc_files = (filename1, filename2)
 
     def test_move(self):
         # Create file info objects to perform move.
-        tasks = []
-        time = datetime.datetime.now()
-        for i in range(len(self.s3_files)):
-            tasks.append(FileInfo(
-                src=self.s3_files[i], src_type='s3',
-                dest=self.loc_files[i], dest_type='local',
-                last_update=time, operation_name='move',
-                size=0, client=self.client, source_client=self.source_client))
+        tasks = [
+            FileInfo(src=src, src_type='s3',
+                     dest=dest, dest_type='local',
+                     last_update=_FIXED_TIME, operation_name='move',
+                     size=0, client=self.client,
+                     source_client=self.source_client)
+            for src, dest in zip(self.s3_files, self.loc_files)
+        ]
         self.parsed_responses = [
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': six.BytesIO(b'This is a test.')},
+            {'ETag': _ETAG,
+             'Body': BytesIO(_TEST_BODY)},
             {},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': six.BytesIO(b'This is a test.')},
+            {'ETag': _ETAG,
+             'Body': BytesIO(_TEST_BODY)},
             {}
         ]
-        ref_calls = [
-            ('GetObject', {'Bucket': self.bucket, 'Key': 'text1.txt'}),
-            ('DeleteObject', {'Bucket': self.bucket, 'Key': 'text1.txt'}),
-            ('GetObject',
-             {'Bucket': self.bucket, 'Key': 'another_directory/text2.txt'}),
-            ('DeleteObject',
-             {'Bucket': self.bucket, 'Key': 'another_directory/text2.txt'}),
-        ]
+        ref_calls = _MV_S3_LOCAL_REF_CALLS
         # Perform the move.
         self.assert_operations_for_s3_handler(self.s3_handler, tasks,
                                               ref_calls)
 
-        # Confirm that the files now exist.
-        for filename in self.loc_files:
-            self.assertTrue(os.path.exists(filename))
-        # Ensure the contents are as expected.
-        with open(self.loc_files[0], 'rb') as filename:
-            self.assertEqual(filename.read(), b'This is a test.')
-        with open(self.loc_files[1], 'rb') as filename:
-            self.assertEqual(filename.read(), b'This is a test.')
+        # Ensure the files now exist and their contents are as expected.
+        self.assert_file_contents(self.loc_files[0], _TEST_BODY)
+        self.assert_file_contents(self.loc_files[1], _TEST_BODY)
 
     def test_move_multi(self):
         tasks = []
-        time = datetime.datetime.now()
         tasks.append(FileInfo(
             src=self.s3_files[0], src_type='s3',
             dest=self.loc_files[0], dest_type='local',
-            last_update=time, operation_name='move',
+            last_update=_FIXED_TIME, operation_name='move',
             size=15, client=self.client, source_client=self.source_client))
-        mock_stream = mock.Mock()
-        mock_stream.read.side_effect = [
-            b'This ', b'', b'is a ', b'', b'test.', b'',
-        ]
-        self.parsed_responses = [
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream},
-            {}
-        ]
-        ref_calls = [
-            ('GetObject',
-             {'Bucket': self.bucket, 'Key': 'text1.txt',
-              'Range': 'bytes=0-4'}),
-            ('GetObject',
-             {'Bucket': self.bucket, 'Key': 'text1.txt',
-              'Range': 'bytes=5-9'}),
-            ('GetObject',
-             {'Bucket': self.bucket, 'Key': 'text1.txt',
-              'Range': 'bytes=10-'}),
-            ('DeleteObject',
-             {'Bucket': self.bucket, 'Key': 'text1.txt'})
-        ]
+        self.parsed_responses = download_part_responses() + [{}]
+        ref_calls = _MV_S3_LOCAL_MULTI_REF_CALLS
         # Perform the multipart  download.
         self.assert_operations_for_s3_handler(self.s3_handler_multi, tasks,
                                               ref_calls)
-        # Confirm that the file now exist.
-        self.assertTrue(os.path.exists(self.loc_files[0]))
-        # Ensure the contents are as expected.
-        with open(self.loc_files[0], 'rb') as filename:
-            self.assertEqual(filename.read(), b'This is a test.')
-
-
-class S3HandlerTestCpS3S3(S3HandlerBaseTest):
+        # Ensure the file now exists and its contents are as expected.
+        self.assert_file_contents(self.loc_files[0], _TEST_BODY)
+
+
+_MULTI_COPY_REF_CALLS = (
+    ('CreateMultipartUpload',
+     {'Bucket': _BUCKET2, 'Key': 'destkey2.txt',
+      'ContentType': 'text/plain'}),
+    ('UploadPartCopy',
+     {'Bucket': _BUCKET2, 'Key': 'destkey2.txt',
+      'PartNumber': 1, 'UploadId': 'foo',
+      'CopySourceRange': 'bytes=0-4',
+      'CopySource': _BUCKET + '/text1.txt'}),
+    ('UploadPartCopy',
+     {'Bucket': _BUCKET2, 'Key': 'destkey2.txt',
+      'PartNumber': 2, 'UploadId': 'foo',
+      'CopySourceRange': 'bytes=5-9',
+      'CopySource': _BUCKET + '/text1.txt'}),
+    ('UploadPartCopy',
+     {'Bucket': _BUCKET2, 'Key': 'destkey2.txt',
+      'PartNumber': 3, 'UploadId': 'foo',
+      'CopySourceRange': 'bytes=10-14',
+      'CopySource': _BUCKET + '/text1.txt'}),
+    ('CompleteMultipartUpload',
+     {'MultipartUpload': {'Parts': [{'PartNumber': 1,
+                                     'ETag': mock.ANY},
+                                    {'PartNumber': 2,
+                                     'ETag': mock.ANY},
+                                    {'PartNumber': 3,
+                                     'ETag': mock.ANY}]},
+      'Bucket': _BUCKET2, 'UploadId': 'foo', 'Key': 'destkey2.txt'}),
+)
+
+
+class S3HandlerTestCpS3S3(S3HandlerMoveBaseTest):
     """
     This class tests the ability to move s3 objects.  The move
     operation uses a copy then delete.
@@ -606,58 +657,24 @@ class S3HandlerTestCpS3S3(S3HandlerBaseTest):
             runtime_config=runtime_config(
                 multipart_threshold=10, multipart_chunksize=5,
                 max_concurrent_requests=1))
-        self.bucket = 'mybucket'
-        self.bucket2 = 'mybucket2'
-        self.s3_files = [self.bucket + '/text1.txt',
-                         self.bucket + '/another_directory/text2.txt']
-        self.s3_files2 = [self.bucket2 + '/text1.txt',
-                          self.bucket2 + '/another_directory/text2.txt']
 
     def test_multi_copy(self):
         # Create file info objects to perform move.
         tasks = []
-        self.s3_files2[0] = 'mybucket2/destkey2.txt'
         tasks.append(FileInfo(src=self.s3_files[0], src_type='s3',
-                              dest=self.s3_files2[0], dest_type='s3',
+                              dest=_BUCKET2 + '/destkey2.txt', dest_type='s3',
                               operation_name='copy', size=15,
                               client=self.client,
                               source_client=self.source_client))
         self.parsed_responses = [
             {'UploadId': 'foo'},
-            {'CopyPartResult': {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'}},
-            {'CopyPartResult': {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'}},
-            {'CopyPartResult': {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'}},
+            {'CopyPartResult': {'ETag': _ETAG}},
+            {'CopyPartResult': {'ETag': _ETAG}},
+            {'CopyPartResult': {'ETag': _ETAG}},
             {}
         ]
 
-        ref_calls = [
-            ('CreateMultipartUpload',
-             {'Bucket': self.bucket2, 'Key': 'destkey2.txt',
-              'ContentType': 'text/plain'}),
-            ('UploadPartCopy',
-             {'Bucket': self.bucket2, 'Key': 'destkey2.txt',
-              'PartNumber': 1, 'UploadId': 'foo',
-              'CopySourceRange': 'bytes=0-4',
-              'CopySource': self.bucket + '/text1.txt'}),
-            ('UploadPartCopy',
-             {'Bucket': self.bucket2, 'Key': 'destkey2.txt',
-              'PartNumber': 2, 'UploadId': 'foo',
-              'CopySourceRange': 'bytes=5-9',
-              'CopySource': self.bucket + '/text1.txt'}),
-            ('UploadPartCopy',
-             {'Bucket': self.bucket2, 'Key': 'destkey2.txt',
-              'PartNumber': 3, 'UploadId': 'foo',
-              'CopySourceRange': 'bytes=10-14',
-              'CopySource': self.bucket + '/text1.txt'}),
-            ('CompleteMultipartUpload',
-             {'MultipartUpload': {'Parts': [{'PartNumber': 1,
-                                             'ETag': mock.ANY},
-                                            {'PartNumber': 2,
-                                             'ETag': mock.ANY},
-                                            {'PartNumber': 3,
-                                             'ETag': mock.ANY}]},
-              'Bucket': self.bucket2, 'UploadId': 'foo', 'Key': 'destkey2.txt'})
-        ]
+        ref_calls = _MULTI_COPY_REF_CALLS
 
         # Perform the copy.
         self.assert_operations_for_s3_handler(self.s3_handler_multi, tasks,
@@ -665,19 +682,20 @@ class S3HandlerTestCpS3S3(S3HandlerBaseTest):
 
     def test_multi_copy_fail(self):
         # Create file info objects to perform move.
-        tasks = []
-        for i in range(len(self.s3_files)):
-            tasks.append(FileInfo(src=self.s3_files[i], src_type='s3',
-                                  dest=self.s3_files2[i], dest_type='s3',
-                                  operation_name='copy', size=15,
-                                  client=self.client,
-                                  source_client=self.source_client))
+        tasks = [
+            FileInfo(src=src, src_type='s3',
+                     dest=dest, dest_type='s3',
+                     operation_name='copy', size=15,
+                     client=self.client,
+                     source_client=self.source_client)
+            for src, dest in zip(self.s3_files, self.s3_files2)
+        ]
 
         self.parsed_responses = [
             {'UploadId': 'foo'},
-            {'CopyPartResult': {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'}},
-            {'CopyPartResult': {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'}},
-            {'CopyPartResult': {'ETag': '"120ea8a25e5d487bf68b5f7096440019"'}},
+            {'CopyPartResult': {'ETag': _ETAG}},
+            {'CopyPartResult': {'ETag': _ETAG}},
+            {'CopyPartResult': {'ETag': _ETAG}},
             {},
             {'UploadId': 'bar'},
             # This will fail because some response is expected for multipart
@@ -691,11 +709,26 @@ class S3HandlerTestCpS3S3(S3HandlerBaseTest):
         self.assertEqual(rc.num_tasks_failed, 1)
 
 
+_DL_REF_CALLS = (
+    ('GetObject', {'Bucket': _BUCKET, 'Key': 'text1.txt'}),
+    ('GetObject',
+     {'Bucket': _BUCKET, 'Key': 'another_directory/text2.txt'}),
+)
+
+_MULTI_DL_REF_CALLS = (
+    download_part_calls(_BUCKET, 'text1.txt') +
+    download_part_calls(_BUCKET, 'another_directory/text2.txt')
+)
+
+
 class S3HandlerTestDownload(S3HandlerBaseTest):
     """
     This class tests the ability to download s3 objects locally as well
     as using multipart downloads
     """
+    bucket = _BUCKET
+    s3_files = _S3_FILES
+
     def setUp(self):
         super(S3HandlerTestDownload, self).setUp()
         params = {'region': 'us-east-1'}
@@ -707,108 +740,51 @@ class S3HandlerTestDownload(S3HandlerBaseTest):
             runtime_config=runtime_config(multipart_threshold=10,
                                           multipart_chunksize=5,
                                           max_concurrent_requests=1))
-        self.bucket = 'mybucket'
-        self.s3_files = [self.bucket + '/text1.txt',
-                         self.bucket + '/another_directory/text2.txt']
-        directory1 = self.file_creator.rootdir + os.sep + 'some_directory' \
-            + os.sep
-        filename1 = directory1 + "text1.txt"
-        directory2 = directory1 + 'another_directory' + os.sep
-        filename2 = directory2 + "text2.txt"
-        self.loc_files = [filename1, filename2]
+        directory1 = os.path.join(self.file_creator.rootdir, 'some_directory')
+        filename1 = os.path.join(directory1, 'text1.txt')
+        filename2 = os.path.join(directory1, 'another_directory', 'text2.txt')
+        self.loc_files = (filename1, filename2)
 
     def test_download(self):
         # Create file info objects to perform download.
-        tasks = []
-        time = datetime.datetime.now()
-        for i in range(len(self.s3_files)):
-            tasks.append(FileInfo(
-                src=self.s3_files[i], src_type='s3',
-                dest=self.loc_files[i], dest_type='local',
-                last_update=time, operation_name='download',
-                size=0, client=self.client))
-        self.parsed_responses = [
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': six.BytesIO(b'This is a test.')},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': six.BytesIO(b'This is a test.')},
+        tasks = [
+            FileInfo(src=src, src_type='s3',
+                     dest=dest, dest_type='local',
+                     last_update=_FIXED_TIME, operation_name='download',
+                     size=0, client=self.client)
+            for src, dest in zip(self.s3_files, self.loc_files)
         ]
-        ref_calls = [
-            ('GetObject', {'Bucket': self.bucket, 'Key': 'text1.txt'}),
-            ('GetObject',
-             {'Bucket': self.bucket, 'Key': 'another_directory/text2.txt'}),
+        self.parsed_responses = [
+            {'ETag': _ETAG,
+             'Body': BytesIO(_TEST_BODY)},
+            {'ETag': _ETAG,
+             'Body': BytesIO(_TEST_BODY)},
         ]
+        ref_calls = _DL_REF_CALLS
         # Perform the download.
         self.assert_operations_for_s3_handler(self.s3_handler, tasks,
                                               ref_calls)
-        # Confirm that the files now exist.
-        for filename in self.loc_files:
-            self.assertTrue(os.path.exists(filename))
-        # Ensure the contents are as expected.
-        with open(self.loc_files[0], 'rb') as filename:
-            self.assertEqual(filename.read(), b'This is a test.')
-        with open(self.loc_files[1], 'rb') as filename:
-            self.assertEqual(filename.read(), b'This is a test.')
+        # Ensure the files exist with the expected contents.
+        self.assert_file_contents(self.loc_files[0], _TEST_BODY)
+        self.assert_file_contents(self.loc_files[1], _TEST_BODY)
 
     def test_multi_download(self):
-        tasks = []
-        time = datetime.datetime.now()
-        for i in range(len(self.s3_files)):
-            tasks.append(FileInfo(
-                src=self.s3_files[i], src_type='s3',
-                dest=self.loc_files[i], dest_type='local',
-                last_update=time, operation_name='download',
-                size=15, client=self.client))
-        mock_stream = mock.Mock()
-        mock_stream.read.side_effect = [
-            b'This ', b'', b'is a ', b'', b'test.', b'',
-            b'This ', b'', b'is a ', b'', b'test.', b''
-        ]
-        self.parsed_responses = [
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream}
-        ]
-        ref_calls = [
-            ('GetObject',
-             {'Bucket': self.bucket, 'Key': 'text1.txt',
-              'Range': 'bytes=0-4'}),
-            ('GetObject',
-             {'Bucket': self.bucket, 'Key': 'text1.txt',
-              'Range': 'bytes=5-9'}),
-            ('GetObject',
-             {'Bucket': self.bucket, 'Key': 'text1.txt',
-              'Range': 'bytes=10-'}),
-            ('GetObject',
-             {'Bucket': self.bucket, 'Key': 'another_directory/text2.txt',
-              'Range': 'bytes=0-4'}),
-            ('GetObject',
-             {'Bucket': self.bucket, 'Key': 'another_directory/text2.txt',
-              'Range': 'bytes=5-9'}),
-            ('GetObject',
-             {'Bucket': self.bucket, 'Key': 'another_directory/text2.txt',
-              'Range': 'bytes=10-'}),
+        tasks = [
+            FileInfo(src=src, src_type='s3',
+                     dest=dest, dest_type='local',
+                     last_update=_FIXED_TIME, operation_name='download',
+                     size=15, client=self.client)
+            for src, dest in zip(self.s3_files, self.loc_files)
         ]
+        self.parsed_responses = (
+            download_part_responses() + download_part_responses())
+        ref_calls = _MULTI_DL_REF_CALLS
         # Perform the multipart  download.
         self.assert_operations_for_s3_handler(self.s3_handler_multi, tasks,
                                               ref_calls)
-        # Confirm that the files now exist.
-        for filename in self.loc_files:
-            self.assertTrue(os.path.exists(filename))
-        # Ensure the contents are as expected.
-        with open(self.loc_files[0], 'rb') as filename:
-            self.assertEqual(filename.read(), b'This is a test.')
-        with open(self.loc_files[1], 'rb') as filename:
-            self.assertEqual(filename.read(), b'This is a test.')
+        # Ensure the files exist with the expected contents.
+        self.assert_file_contents(self.loc_files[0], _TEST_BODY)
+        self.assert_file_contents(self.loc_files[1], _TEST_BODY)
 
     def test_multi_download_fail(self):
         """
@@ -817,27 +793,16 @@ class S3HandlerTestDownload(S3HandlerBaseTest):
         being performed on a nonexistant bucket.  The existing file
         should be downloaded properly but the other will not.
         """
-        tasks = []
         wrong_s3_files = [self.bucket + '/text1.txt',
                           self.bucket[:-1] + '/another_directory/text2.txt']
-        time = datetime.datetime.now()
-        for i in range(len(self.s3_files)):
-            tasks.append(FileInfo(
-                src=wrong_s3_files[i], src_type='s3',
-                dest=self.loc_files[i], dest_type='local',
-                last_update=time, operation_name='download',
-                size=15, client=self.client))
-        mock_stream = mock.Mock()
-        mock_stream.read.side_effect = [
-            b'This ', b'', b'is a ', b'', b'test.', b''
+        tasks = [
+            FileInfo(src=src, src_type='s3',
+                     dest=dest, dest_type='local',
+                     last_update=_FIXED_TIME, operation_name='download',
+                     size=15, client=self.client)
+            for src, dest in zip(wrong_s3_files, self.loc_files)
         ]
-        self.parsed_responses = [
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream},
-            {'ETag': '"120ea8a25e5d487bf68b5f7096440019"',
-             'Body': mock_stream},
+        self.parsed_responses = download_part_responses() + [
             # Response with no body will throw an error for the second
             # multipart download.
             {},
@@ -846,13 +811,14 @@ class S3HandlerTestDownload(S3HandlerBaseTest):
         ]
         # Perform the multipart  download.
         stdout, stderr, rc = self.run_s3_handler(self.s3_handler_multi, tasks)
-        # Confirm that the files now exist.
-        self.assertTrue(os.path.exists(self.loc_files[0]))
+        # Every part of both downloads is requested, and each of the
+        # second file's three parts fails on its missing body.
+        self.assertEqual(len(self.operations_called), 6)
+        self.assertEqual(stderr.count("'Body'"), 3)
         # The second file should not exist.
         self.assertFalse(os.path.exists(self.loc_files[1]))
-        # Ensure that contents are as expected.
-        with open(self.loc_files[0], 'rb') as filename:
-            self.assertEqual(filename.read(), b'This is a test.')
+        # Ensure the first file exists with the expected contents.
+        self.assert_file_contents(self.loc_files[0], _TEST_BODY)
 
 
 class S3HandlerTestBucket(S3HandlerBaseTest):
@@ -862,14 +828,16 @@ class S3HandlerTestBucket(S3HandlerBaseTest):
     def setUp(self):
         super(S3HandlerTestBucket, self).setUp()
         self.params = {'region': 'us-east-1'}
-        self.bucket = 'mybucket'
+        self.bucket = _BUCKET
 
     def test_remove_bucket(self):
         file_info = FileInfo(
             src=self.bucket,
             operation_name='remove_bucket',
             size=0, client=self.client)
-        s3_handler = S3Handler(self.session, self.params)
+        s3_handler = S3Handler(self.session, self.params,
+                               runtime_config=runtime_config(
+                                   max_concurrent_requests=1))
         ref_calls = [
             ('DeleteBucket', {'Bucket': self.bucket})
         ]
@@ -877,19 +845,37 @@ class S3HandlerTestBucket(S3HandlerBaseTest):
                                               ref_calls)
 
 
-class TestS3TransferHandler(S3HandlerBaseTest):
+class TestS3TransferHandler(unittest.TestCase):
+    # The handlers are always given a fake transfer manager, so they never
+    # use a session and no real one needs to be built.
+    session = None
+
+    @classmethod
+    def setUpClass(cls):
+        # The handler does not modify the FileInfo it transfers, so these
+        # can be shared by every test in the class.
+        cls.upload_file = FileInfo('-', 'foo-bucket/bar.txt', is_stream=True,
+                                   operation_name='upload')
+        cls.download_file = FileInfo('foo-bucket/bar.txt', '-',
+                                     is_stream=True, operation_name='download')
+
     def setUp(self):
-        super(TestS3TransferHandler, self).setUp()
         self.params = {'is_stream': True, 'region': 'us-east-1'}
-        self.transfer_manager = mock.Mock(spec=TransferManager)
-        self.transfer_manager.__enter__ = mock.Mock()
-        self.transfer_manager.__exit__ = mock.Mock()
-        self.transfer_future = mock.Mock(spec=TransferFuture)
-        self.transfer_manager.upload.return_value = self.transfer_future
-        self.transfer_manager.download.return_value = self.transfer_future
-
-        # This gets reset in S3HandlerBaseTest
-        awscli.customizations.s3.utils.MIN_UPLOAD_CHUNKSIZE = 5 * (1024 ** 2)
+        self.transfer_future = FakeTransferFuture()
+        self.transfer_manager = FakeTransferManager(self.transfer_future)
+
+        self._saved_min_chunksize = \
+            awscli.customizations.s3.utils.MIN_UPLOAD_CHUNKSIZE
+        self.min_chunksize = 5 * (1024 ** 2)
+        self.max_chunksize = MAX_SINGLE_UPLOAD_SIZE
+        # MIN_UPLOAD_CHUNKSIZE is read from the utils module at call time,
+        # so it has to be overridden there rather than bound locally.
+        awscli.customizations.s3.utils.MIN_UPLOAD_CHUNKSIZE = \
+            self.min_chunksize
+
+    def tearDown(self):
+        awscli.customizations.s3.utils.MIN_UPLOAD_CHUNKSIZE = \
+            self._saved_min_chunksize
 
     def assert_chunk_size_in_range(self, size, maximum=None, minimum=None):
         """
@@ -897,21 +883,20 @@ class TestS3TransferHandler(S3HandlerBaseTest):
         default range being the allowable chunk size range for UploadPart.
         """
         if maximum is None:
-            maximum = awscli.customizations.s3.utils.MAX_SINGLE_UPLOAD_SIZE
+            maximum = self.max_chunksize
         if minimum is None:
-            minimum = awscli.customizations.s3.utils.MIN_UPLOAD_CHUNKSIZE
+            minimum = self.min_chunksize
 
-        self.assertLessEqual(size, maximum)
-        self.assertGreaterEqual(size, minimum)
+        self.assertTrue(
+            minimum <= size <= maximum,
+            'Chunksize %s is not within [%s, %s]' % (size, minimum, maximum))
 
     def test_upload_stream(self):
         handler = S3TransferStreamHandler(
             self.session, self.params, manager=self.transfer_manager)
-        file = FileInfo('-', 'foo-bucket/bar.txt', is_stream=True,
-                        operation_name='upload')
 
-        with capture_input(b'foobar'):
-            response = handler.call([file])
+        with capture_input(_STREAM_INPUT):
+            response = handler.call([self.upload_file])
 
         self.assertEqual(response.num_tasks_failed, 0)
         self.assertEqual(response.num_tasks_warned, 0)
@@ -922,14 +907,12 @@ class TestS3TransferHandler(S3HandlerBaseTest):
 
     def test_upload_stream_with_expected_size(self):
         expected_size = 6
-        self.params['expected_size'] = expected_size
+        params = dict(self.params, expected_size=expected_size)
         handler = S3TransferStreamHandler(
-            self.session, self.params, manager=self.transfer_manager)
-        file = FileInfo('-', 'foo-bucket/bar.txt', is_stream=True,
-                        operation_name='upload')
+            self.session, params, manager=self.transfer_manager)
 
-        with capture_input(b'foobar'):
-            handler.call([file])
+        with capture_input(_STREAM_INPUT):
+            handler.call([self.upload_file])
 
         # Assert that there is a subscriber.
         call_args = self.transfer_manager.upload.call_args[1]
@@ -943,67 +926,52 @@ class TestS3TransferHandler(S3HandlerBaseTest):
         # Validate that the size on the subscriber is the expected size
         self.assertEqual(subscriber.size, expected_size)
 
-    def test_upload_modifies_chunksize_if_too_low(self):
-        config = runtime_config(multipart_chunksize=1)
+    def upload_stream_with_chunksize(self, chunksize, expected_size=None):
+        """Upload a stream with a configured chunksize
+
+        :returns: The multipart chunksize the handler ended up using.
+        """
+        params = self.params
+        if expected_size is not None:
+            params = dict(params, expected_size=expected_size)
+        config = runtime_config(multipart_chunksize=chunksize)
         handler = S3TransferStreamHandler(
-            self.session, self.params, runtime_config=config,
+            self.session, params, runtime_config=config,
             manager=self.transfer_manager)
-        file = FileInfo('-', 'foo-bucket/bar.txt', is_stream=True,
-                        operation_name='upload')
-
-        with capture_input(b'foobar'):
-            handler.call([file])
 
-        chunksize = handler.config.multipart_chunksize
-        self.assert_chunk_size_in_range(chunksize)
+        with capture_input(_STREAM_INPUT):
+            handler.call([self.upload_file])
 
-    def test_upload_modifies_chunksize_if_too_high(self):
-        config = runtime_config(multipart_chunksize=6 * (1024 ** 3))
-        handler = S3TransferStreamHandler(
-            self.session, self.params, runtime_config=config,
-            manager=self.transfer_manager)
-        file = FileInfo('-', 'foo-bucket/bar.txt', is_stream=True,
-                        operation_name='upload')
+        return handler.config.multipart_chunksize
 
-        with capture_input(b'foobar'):
-            handler.call([file])
+    def test_upload_modifies_chunksize_if_too_low(self):
+        self.assert_chunk_size_in_range(
+            self.upload_stream_with_chunksize(1))
 
-        chunksize = handler.config.multipart_chunksize
-        self.assert_chunk_size_in_range(chunksize)
+    def test_upload_modifies_chunksize_if_too_high(self):
+        self.assert_chunk_size_in_range(
+            self.upload_stream_with_chunksize(6 * (1024 ** 3)))
 
     def test_upload_modifies_chunksize_for_max_parts_if_size_known(self):
         expected_size = 6 * (1024 ** 3)
-        max_parts = awscli.customizations.s3.utils.MAX_PARTS
-
         # Set the chunksize to end up with way more than the max parts.
-        chunksize = int((expected_size / (max_parts * 2)) + 1)
-        self.params['expected_size'] = expected_size
-        config = runtime_config(multipart_chunksize=chunksize)
-        handler = S3TransferStreamHandler(
-            self.session, self.params, runtime_config=config,
-            manager=self.transfer_manager)
-        file = FileInfo('-', 'foo-bucket/bar.txt', is_stream=True,
-                        operation_name='upload')
-
-        with capture_input(b'foobar'):
-            handler.call([file])
+        chunksize = int((expected_size / (MAX_PARTS * 2)) + 1)
+        actual_chunksize = self.upload_stream_with_chunksize(
+            chunksize, expected_size)
 
         # The chunksize should at least be large enough to fit within max parts
-        minimum_chunksize = int(expected_size / max_parts)
-        actual_chunksize = handler.config.multipart_chunksize
+        minimum_chunksize = int(expected_size / MAX_PARTS)
         self.assert_chunk_size_in_range(
             actual_chunksize, minimum=minimum_chunksize)
 
     def test_upload_swallows_exceptions(self):
         handler = S3TransferStreamHandler(
             self.session, self.params, manager=self.transfer_manager)
-        file = FileInfo('-', 'foo-bucket/bar.txt', is_stream=True,
-                        operation_name='upload')
 
         self.transfer_future.result.side_effect = Exception()
 
-        with capture_input(b'foobar'):
-            response = handler.call([file])
+        with capture_input(_STREAM_INPUT):
+            response = handler.call([self.upload_file])
 
         self.assertEqual(response.num_tasks_failed, 1)
         self.assertEqual(response.num_tasks_warned, 0)
@@ -1011,10 +979,8 @@ class TestS3TransferHandler(S3HandlerBaseTest):
     def test_download_stream(self):
         handler = S3TransferStreamHandler(
             self.session, self.params, manager=self.transfer_manager)
-        file = FileInfo('foo-bucket/bar.txt', '-', is_stream=True,
-                        operation_name='download')
 
-        response = handler.call([file])
+        response = handler.call([self.download_file])
         self.assertEqual(response.num_tasks_failed, 0)
         self.assertEqual(response.num_tasks_warned, 0)
 
@@ -1025,12 +991,10 @@ class TestS3TransferHandler(S3HandlerBaseTest):
     def test_download_swallows_exceptions(self):
         handler = S3TransferStreamHandler(
             self.session, self.params, manager=self.transfer_manager)
-        file = FileInfo('foo-bucket/bar.txt', '-', is_stream=True,
-                        operation_name='download')
 
         self.transfer_future.result.side_effect = Exception()
 
-        response = handler.call([file])
+        response = handler.call([self.download_file])
         self.assertEqual(response.num_tasks_failed, 1)
         self.assertEqual(response.num_tasks_warned, 0)
 